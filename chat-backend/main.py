@@ -2,15 +2,44 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Set, Deque
 from datetime import datetime, timedelta
-from jose import JWTError, jwt
+from jwt.exceptions import InvalidTokenError as JWTError
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from uuid import uuid4
+from bson import ObjectId
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from pymongo.errors import DuplicateKeyError
 import motor.motor_asyncio
+import asyncio
+import bcrypt
+import contextlib
+import hashlib
+import hmac
+import jwt
+import logging
+import msgpack
 import random
-import json
+import os
+import orjson
+import time
 
-app = FastAPI()
+class MongoORJSONResponse(ORJSONResponse):
+    # Same options as ORJSONResponse, plus a str() fallback for BSON types such as ObjectId
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+app = FastAPI(default_response_class=MongoORJSONResponse)
+logger = logging.getLogger(__name__)
 
 # CORS middleware
 app.add_middleware(
@@ -22,50 +51,231 @@ app.add_middleware(
 )
 
 # Database connection
-client = motor.motor_asyncio.AsyncIOMotorClient("mongodb://localhost:27017")
+# Keep a warm pool so bursts don't pay for new TCP handshakes
+client = motor.motor_asyncio.AsyncIOMotorClient(
+    "mongodb://localhost:27017",
+    maxPoolSize=50,
+    minPoolSize=10,
+    maxIdleTimeMS=60_000,
+    connectTimeoutMS=5_000,
+    compressors="zstd",
+)
 db = client.chatapp
 
+# Buffered inserts, flushed with insert_many by a background task
+class BatchWriter:
+    def __init__(self, collection, max_batch: int = 500, interval: float = 0.05):
+        self.collection = collection
+        self.max_batch = max_batch
+        self.interval = interval
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def put(self, document: dict) -> ObjectId:
+        # Assign the id up front so callers can acknowledge before the write lands
+        document["_id"] = ObjectId()
+        self.queue.put_nowait(document)
+        if self.queue.qsize() >= self.max_batch:
+            self._wakeup.set()
+        return document["_id"]
+
+    async def flush(self):
+        while not self.queue.empty():
+            batch = []
+            while not self.queue.empty() and len(batch) < self.max_batch:
+                batch.append(self.queue.get_nowait())
+            try:
+                await self.collection.insert_many(batch, ordered=False)
+            except Exception:
+                logger.exception("Failed to write %d documents to %s", len(batch), self.collection.name)
+
+    async def run(self):
+        # Flushes every interval, or as soon as a full batch is queued
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def start(self):
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        # Let an in-flight insert_many finish instead of cancelling it, then drain the rest
+        self._stopping.set()
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+        await self.flush()
+
+chat_session_writer = BatchWriter(db.chat_sessions)
+rating_writer = BatchWriter(db.ratings)
+batch_writers = [chat_session_writer, rating_writer]
+
+@app.on_event("startup")
+async def create_indexes():
+    await db.users.create_index("username", unique=True)
+    await db.chat_sessions.create_index("session_id")
+    await db.ratings.create_index([("session_id", 1), ("user", 1)])
+
+@app.on_event("startup")
+async def start_batch_writers():
+    for writer in batch_writers:
+        writer.start()
+
+@app.on_event("shutdown")
+async def stop_batch_writers():
+    for writer in batch_writers:
+        await writer.stop()
+
+# Subprotocol a client offers to exchange msgpack instead of JSON
+MSGPACK_SUBPROTOCOL = "msgpack"
+
+def encode_message(message: dict) -> str:
+    # orjson instead of Starlette's stdlib-json send_json; still sent as a text frame
+    return orjson.dumps(message).decode()
+
+def uses_msgpack(websocket: WebSocket) -> bool:
+    return getattr(websocket.state, "msgpack", False)
+
+class OutgoingMessage:
+    # Encodes at most once per wire format, however many sockets it goes to
+    __slots__ = ("message", "_text", "_packed")
+
+    def __init__(self, message: dict):
+        self.message = message
+        self._text: Optional[str] = None
+        self._packed: Optional[bytes] = None
+
+    async def send(self, websocket: WebSocket):
+        if uses_msgpack(websocket):
+            if self._packed is None:
+                self._packed = msgpack.packb(self.message, use_bin_type=True)
+            await websocket.send_bytes(self._packed)
+        else:
+            if self._text is None:
+                self._text = encode_message(self.message)
+            await websocket.send_text(self._text)
+
+async def send_json(websocket: WebSocket, message: dict):
+    await OutgoingMessage(message).send(websocket)
+
+async def receive_json(websocket: WebSocket) -> dict:
+    # JSON clients send binary frames, which skip the server's UTF-8 text validation;
+    # orjson.loads still rejects invalid UTF-8. Text frames are accepted too.
+    frame = await websocket.receive()
+    if frame["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(frame.get("code", 1000))
+    data = frame.get("bytes")
+    if data is None:
+        data = frame["text"]
+    elif uses_msgpack(websocket):
+        return msgpack.unpackb(data, raw=False)
+    return orjson.loads(data)
+
 # Models
 class User(BaseModel):
     username: str
     hashed_password: str
+
+class CurrentUser(BaseModel):
+    username: str
     
 class ChatUser:
-    def __init__(self, username: str, websocket: WebSocket):
+    # One instance per open socket, so skip the per-instance __dict__
+    __slots__ = ("username", "websocket", "claims")
+
+    def __init__(self, username: str, websocket: WebSocket, claims: Optional[dict] = None):
         self.username = username
         self.websocket = websocket
+        self.claims = claims
     
+@dataclass(slots=True)
+class Session:
+    a: ChatUser
+    b: ChatUser
+
+    def partner_of(self, user: ChatUser) -> ChatUser:
+        return self.b if user is self.a else self.a
+
+    def __iter__(self):
+        yield self.a
+        yield self.b
+
 class PairingManager:
     def __init__(self):
-        self.waiting_users: List[ChatUser] = []
-        self.active_pairs: Dict[str, List[ChatUser]] = {}
+        self.waiting_users: Deque[ChatUser] = deque()
+        # Source of truth for who is waiting; users removed from it are skipped lazily in the deque
+        self.waiting_set: Set[ChatUser] = set()
+        self.active_pairs: Dict[str, Session] = {}
+        # Keyed per socket, not per username: one user may have several tabs open
+        self.user_to_session: Dict[ChatUser, str] = {}
+
+    def pop_waiting_user(self) -> Optional[ChatUser]:
+        while self.waiting_users:
+            user = self.waiting_users.popleft()
+            if user in self.waiting_set:
+                self.waiting_set.discard(user)
+                return user
+        return None
+
+    def remove_waiting_user(self, user: ChatUser):
+        self.waiting_set.discard(user)
+
+    def connected_users(self) -> List[ChatUser]:
+        users = list(self.waiting_set)
+        for session in self.active_pairs.values():
+            users.extend(session)
+        return users
 
     async def add_user(self, user: ChatUser):
-        if self.waiting_users:
-            partner = self.waiting_users.pop(0)
-            session_id = f"{user.username}-{partner.username}"
-            self.active_pairs[session_id] = [user, partner]
+        partner = self.pop_waiting_user()
+        if partner is not None:
+            # The suffix keeps ids unique when the same two usernames pair again from other tabs
+            session_id = f"{user.username}-{partner.username}-{uuid4().hex}"
+            self.active_pairs[session_id] = Session(user, partner)
             await self.start_session(session_id)
         else:
             self.waiting_users.append(user)
+            self.waiting_set.add(user)
 
     async def start_session(self, session_id: str):
-        users = self.active_pairs[session_id]
-        for user in users:
-            await user.websocket.send_json({
+        session = self.active_pairs[session_id]
+        for user in session:
+            self.user_to_session[user] = session_id
+        await asyncio.gather(*(
+            send_json(user.websocket, {
                 "type": "session_start",
                 "session_id": session_id,
-                "partner": users[1].username if user == users[0] else users[0].username
+                "partner": session.partner_of(user).username
             })
+            for user in session
+        ), return_exceptions=True)
 
     async def end_session(self, session_id: str):
         if session_id in self.active_pairs:
-            users = self.active_pairs.pop(session_id)
-            for user in users:
-                await user.websocket.send_json({
-                    "type": "session_end",
-                    "session_id": session_id
-                })
+            session = self.active_pairs.pop(session_id)
+            for user in session:
+                self.user_to_session.pop(user, None)
+            outgoing = OutgoingMessage({
+                "type": "session_end",
+                "session_id": session_id
+            })
+            # A partner that already disconnected must not stop the other from being notified
+            await asyncio.gather(
+                *(outgoing.send(user.websocket) for user in session),
+                return_exceptions=True,
+            )
+
+    async def remove_user(self, user: ChatUser):
+        session_id = self.user_to_session.get(user)
+        if session_id is not None and user in self.active_pairs.get(session_id, ()):
+            await self.end_session(session_id)
+        self.remove_waiting_user(user)
 
 pairing_manager = PairingManager()
 
@@ -84,19 +294,108 @@ class Rating(BaseModel):
     is_human_guess: bool
 
 # Authentication
-SECRET_KEY = "your-secret-key"
-ALGORITHM = "HS256"
+ALGORITHM = "RS256"
+ALGORITHMS = [ALGORITHM]
+
+def load_signing_keys():
+    private_pem = os.getenv("PRIVATE_KEY_PEM")
+    public_pem = os.getenv("PUBLIC_KEY_PEM")
+    if private_pem:
+        private_key = serialization.load_pem_private_key(private_pem.encode(), password=None)
+        if public_pem:
+            return private_key, serialization.load_pem_public_key(public_pem.encode())
+        return private_key, private_key.public_key()
+    if public_pem:
+        raise RuntimeError("PUBLIC_KEY_PEM is set but PRIVATE_KEY_PEM is not; tokens cannot be signed")
+    # Development fallback: tokens stop validating on restart and across workers
+    logger.warning("PRIVATE_KEY_PEM/PUBLIC_KEY_PEM not set, using an ephemeral RSA key")
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return private_key, private_key.public_key()
+
+# Parsed once at import so PEM decoding never happens on the verify path
+PRIVATE_KEY, PUBLIC_KEY = load_signing_keys()
+# Built once and reused for every decode
+DECODE_KWARGS = {"key": PUBLIC_KEY, "algorithms": ALGORITHMS}
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+JWT_CACHE_MAX_SIZE = 10_000
+PASSWORD_CACHE_MAX_SIZE = 1000
+PASSWORD_CACHE_TTL_SECONDS = 10
+
+# bcrypt only looks at the first 72 bytes; longer passwords are rejected at registration
+BCRYPT_MAX_PASSWORD_BYTES = 72
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+# Verified against when the username is unknown, so both failure paths cost one bcrypt check
+_DUMMY_PASSWORD = b"dummy-password"
+_DUMMY_HASH = bcrypt.hashpw(_DUMMY_PASSWORD, bcrypt.gensalt())
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
+# Decoded payloads keyed by raw token, kept until the token's exp (LRU order)
+_jwt_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+# Recently verified credentials (digest -> expiry) so reconnect storms skip bcrypt
+_password_cache: "OrderedDict[bytes, float]" = OrderedDict()
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, PRIVATE_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def verify_token(token: str) -> dict:
+    cached = _jwt_cache.get(token)
+    if cached is not None:
+        exp, payload = cached
+        if exp > time.time():
+            _jwt_cache.move_to_end(token)
+            return payload
+        del _jwt_cache[token]
+    # Raises JWTError on invalid or expired tokens, so those are never cached
+    payload = jwt.decode(token, **DECODE_KWARGS)
+    exp = payload.get("exp")
+    if exp is not None:
+        _jwt_cache[token] = (float(exp), payload)
+        if len(_jwt_cache) > JWT_CACHE_MAX_SIZE:
+            _jwt_cache.popitem(last=False)
+    return payload
+
+def hash_password(plain_password: str) -> str:
+    return bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt()).decode()
+
+def dummy_verify_password():
+    bcrypt.checkpw(_DUMMY_PASSWORD, _DUMMY_HASH)
+
+async def verify_password(username: str, plain_password: str, hashed_password: str) -> bool:
+    # The stored hash is part of the key, so a password change invalidates the entry
+    key = hashlib.sha256(f"{username}\0{plain_password}\0{hashed_password}".encode()).digest()
+    expires_at = _password_cache.get(key)
+    if expires_at is not None:
+        if expires_at > time.time():
+            _password_cache.move_to_end(key)
+            return True
+        del _password_cache[key]
+    plain_bytes = plain_password.encode()
+    if not hashed_password.startswith(BCRYPT_PREFIXES):
+        # Accounts created before hashing store the plaintext; verify it and upgrade in place
+        verified = hmac.compare_digest(plain_bytes, hashed_password.encode())
+        if verified and len(plain_bytes) <= BCRYPT_MAX_PASSWORD_BYTES:
+            await db.users.update_one(
+                {"username": username, "hashed_password": hashed_password},
+                {"$set": {"hashed_password": await run_in_threadpool(hash_password, plain_password)}},
+            )
+    elif len(plain_bytes) > BCRYPT_MAX_PASSWORD_BYTES:
+        # Too long to have been registered
+        verified = False
+    else:
+        # bcrypt is deliberately slow; keep it off the event loop
+        verified = await run_in_threadpool(bcrypt.checkpw, plain_bytes, hashed_password.encode())
+    if verified:
+        _password_cache[key] = time.time() + PASSWORD_CACHE_TTL_SECONDS
+        if len(_password_cache) > PASSWORD_CACHE_MAX_SIZE:
+            _password_cache.popitem(last=False)
+    return verified
+
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     credentials_exception = HTTPException(
         status_code=401,
@@ -104,32 +403,47 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verify_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
-    user = await db.users.find_one({"username": username})
+    user = await db.users.find_one({"username": username}, {"username": 1, "_id": 0})
     if user is None:
         raise credentials_exception
-    return User(**user)
+    return CurrentUser(**user)
 
 # Routes
 @app.post("/token")
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    user = await db.users.find_one({"username": form_data.username})
-    if not user or user["hashed_password"] != form_data.password:  # In production, use proper password hashing
+    user = await db.users.find_one(
+        {"username": form_data.username}, {"username": 1, "hashed_password": 1, "_id": 0}
+    )
+    if not user:
+        # Spend the same bcrypt time as a wrong password so unknown usernames don't answer faster
+        await run_in_threadpool(dummy_verify_password)
+        raise HTTPException(status_code=400, detail="Incorrect username or password")
+    if not await verify_password(form_data.username, form_data.password, user["hashed_password"]):
         raise HTTPException(status_code=400, detail="Incorrect username or password")
     access_token = create_access_token(data={"sub": user["username"]})
     return {"access_token": access_token, "token_type": "bearer"}
 
 @app.post("/register")
 async def register(user: User):
-    existing_user = await db.users.find_one({"username": user.username})
-    if existing_user:
+    if len(user.hashed_password.encode()) > BCRYPT_MAX_PASSWORD_BYTES:
+        raise HTTPException(
+            status_code=400, detail=f"Password must be at most {BCRYPT_MAX_PASSWORD_BYTES} bytes"
+        )
+    # The unique index on username rejects duplicates, no separate lookup needed
+    try:
+        # The client sends the plain password in hashed_password; hash it before storing
+        await db.users.insert_one({
+            "username": user.username,
+            "hashed_password": await run_in_threadpool(hash_password, user.hashed_password),
+        })
+    except DuplicateKeyError:
         raise HTTPException(status_code=400, detail="Username already registered")
-    await db.users.insert_one(user.dict())
     return {"message": "User registered successfully"}
 
 # WebSocket connection manager
@@ -145,19 +459,64 @@ class ConnectionManager:
         self.active_connections.remove(websocket)
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
-        await websocket.send_json(message)
+        await send_json(websocket, message)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            await connection.send_json(message)
+        outgoing = OutgoingMessage(message)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(outgoing.send(connection) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception) and connection in self.active_connections:
+                self.active_connections.remove(connection)
 
 manager = ConnectionManager()
 
+HEARTBEAT_INTERVAL_SECONDS = 30
+_heartbeat_task: Optional[asyncio.Task] = None
+
+async def sweep_dead_connections():
+    # Finds dead sockets off the message path instead of waiting for a send to fail
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
+        heartbeat = OutgoingMessage({"type": "heartbeat"})
+        users = pairing_manager.connected_users()
+        results = await asyncio.gather(
+            *(heartbeat.send(user.websocket) for user in users),
+            return_exceptions=True,
+        )
+        for user, result in zip(users, results):
+            if isinstance(result, Exception):
+                await pairing_manager.remove_user(user)
+
+@app.on_event("startup")
+async def start_heartbeat():
+    global _heartbeat_task
+    _heartbeat_task = asyncio.create_task(sweep_dead_connections())
+
+@app.on_event("shutdown")
+async def stop_heartbeat():
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _heartbeat_task
+
 # WebSocket endpoint for chat
-@app.websocket("/ws/{token}")
-async def websocket_endpoint(websocket: WebSocket, token: str):
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    # The JWT arrives as a Sec-WebSocket-Protocol value so it stays out of URLs and access logs,
+    # optionally next to MSGPACK_SUBPROTOCOL to ask for msgpack frames
+    protocols = [p.strip() for p in websocket.headers.get("sec-websocket-protocol", "").split(",") if p.strip()]
+    use_msgpack = MSGPACK_SUBPROTOCOL in protocols
+    tokens = [p for p in protocols if p != MSGPACK_SUBPROTOCOL]
+    if not tokens:
+        await websocket.close(code=1008)  # Policy Violation
+        return
+    token = tokens[0]
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = verify_token(token)
         username: str = payload.get("sub")
         if username is None:
             await websocket.close(code=1008)  # Policy Violation
@@ -166,60 +525,69 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
         await websocket.close(code=1008)  # Policy Violation
         return
 
-    await websocket.accept()
-    chat_user = ChatUser(username=username, websocket=websocket)
+    # Browsers drop the connection unless the server echoes one of the offered subprotocols
+    websocket.state.msgpack = use_msgpack
+    await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if use_msgpack else token)
+    chat_user = ChatUser(username=username, websocket=websocket, claims=payload)
     await pairing_manager.add_user(chat_user)
 
     try:
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            message = await receive_json(websocket)
             if message["type"] == "chat_message":
                 session_id = message["session_id"]
                 if session_id in pairing_manager.active_pairs:
-                    users = pairing_manager.active_pairs[session_id]
-                    for u in users:
-                        await u.websocket.send_json({
-                            "type": "chat_message",
-                            "session_id": session_id,
-                            "user": username,
-                            "message": message["content"]
-                        })
+                    session = pairing_manager.active_pairs[session_id]
+                    outgoing = OutgoingMessage({
+                        "type": "chat_message",
+                        "session_id": session_id,
+                        "user": username,
+                        "message": message["content"]
+                    })
+                    await asyncio.gather(
+                        *(outgoing.send(u.websocket) for u in session),
+                        return_exceptions=True,
+                    )
             elif message["type"] == "end_session":
                 await pairing_manager.end_session(message["session_id"])
     except WebSocketDisconnect:
         # Handle disconnection
-        for session_id, users in pairing_manager.active_pairs.items():
-            if chat_user in users:
-                await pairing_manager.end_session(session_id)
-                break
-        if chat_user in pairing_manager.waiting_users:
-            pairing_manager.waiting_users.remove(chat_user)
+        await pairing_manager.remove_user(chat_user)
 
 # API routes for chat sessions and ratings
 @app.post("/chat-sessions")
-async def create_chat_session(session: ChatSession, current_user: User = Depends(get_current_user)):
-    result = await db.chat_sessions.insert_one(session.dict())
-    return {"message": "Chat session created", "session_id": str(result.inserted_id)}
+async def create_chat_session(session: ChatSession, current_user: CurrentUser = Depends(get_current_user)):
+    inserted_id = chat_session_writer.put(session.model_dump())
+    return {"message": "Chat session created", "session_id": str(inserted_id)}
 
 @app.get("/chat-sessions/{session_id}")
-async def get_chat_session(session_id: str, current_user: User = Depends(get_current_user)):
+async def get_chat_session(session_id: str, current_user: CurrentUser = Depends(get_current_user)):
     session = await db.chat_sessions.find_one({"session_id": session_id})
     if session:
-        return session
+        # Returned directly so FastAPI's jsonable_encoder doesn't choke on ObjectId
+        return MongoORJSONResponse(session)
     raise HTTPException(status_code=404, detail="Chat session not found")
 
 @app.post("/ratings")
-async def submit_rating(rating: Rating, current_user: User = Depends(get_current_user)):
-    result = await db.ratings.insert_one(rating.dict())
-    return {"message": "Rating submitted", "rating_id": str(result.inserted_id)}
+async def submit_rating(rating: Rating, current_user: CurrentUser = Depends(get_current_user)):
+    inserted_id = rating_writer.put(rating.model_dump())
+    return {"message": "Rating submitted", "rating_id": str(inserted_id)}
 
 # Run the application
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Pairing state lives in this process, so keep WEB_CONCURRENCY at 1 unless it is shared
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        ws_max_size=2**20,
+    )
     
 # TO RUN MONGODB AS A SERVICE # brew services start mongodb-community@7.0
-# TO RUN THE FASTAPI APP # uvicorn main:app --reload
+# TO RUN THE FASTAPI APP # uvicorn main:app --reload --loop uvloop --http httptools
 # TO ACCESS THE API DOCUMENTATION # http://127.0.0.1:8000/docs
 # Open another termainal and run: first move (cd) to the chat-frontend path and then run npm start 
\ No newline at end of file
@@ -9,9 +9,16 @@ function Chat({ token, onLogout }) {
   const [partner, setPartner] = useState(null);
   const [status, setStatus] = useState('Waiting for partner...');
   const messagesEndRef = useRef(null);
+  const encoder = useRef(new TextEncoder());
+
+  // Binary frames let the server skip UTF-8 validation of text frames
+  const sendJson = (message) => {
+    websocket.send(encoder.current.encode(JSON.stringify(message)));
+  };
 
   useEffect(() => {
-    const ws = new WebSocket(`ws://localhost:8000/ws/${token}`);
+    // The token travels as the subprotocol so it never appears in the URL
+    const ws = new WebSocket('ws://localhost:8000/ws', [token]);
     
     ws.onopen = () => {
       console.log('WebSocket Connected');
@@ -34,6 +41,8 @@ function Chat({ token, onLogout }) {
           setPartner(null);
           setMessages([]);
           break;
+        case 'heartbeat':
+          break;
         default:
           console.log('Unknown message type:', data.type);
       }
@@ -63,7 +72,7 @@ function Chat({ token, onLogout }) {
         session_id: sessionId,
         content: inputMessage
       };
-      websocket.send(JSON.stringify(message));
+      sendJson(message);
       setInputMessage('');
     }
   };
@@ -74,7 +83,7 @@ function Chat({ token, onLogout }) {
         type: 'end_session',
         session_id: sessionId
       };
-      websocket.send(JSON.stringify(message));
+      sendJson(message);
     }
   };
 